@@ -0,0 +1,105 @@
+"""Response caching for Smart Study Buddy tools and agents."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+import diskcache
+import orjson
+
+
+def make_cache_key(*parts: str) -> str:
+    """
+    Build a stable content-hash key from one or more string parts.
+
+    Args:
+        parts: Values that together identify a cached response
+
+    Returns:
+        Hex digest usable as a cache key
+    """
+    digest = hashlib.blake2b()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")  # Separator so ("ab", "c") != ("a", "bc")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Two-level cache: an in-process LRU in front of an optional on-disk store."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl: float = 86400.0,
+        maxsize: int = 128,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: On-disk cache directory, or None for in-process caching only
+            ttl: Time-to-live in seconds for on-disk entries
+            maxsize: Maximum number of entries kept in the in-process LRU
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lru: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: Optional[diskcache.Cache] = (
+            diskcache.Cache(os.path.expanduser(directory)) if directory else None
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                return self._lru[key]
+
+        if self._disk is None:
+            return None
+
+        raw = self._disk.get(key)
+        if raw is None:
+            return None
+
+        value = orjson.loads(raw)
+        self._store_in_memory(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable value.
+
+        Args:
+            key: Cache key from make_cache_key()
+            value: Value to cache
+        """
+        self._store_in_memory(key, value)
+        if self._disk is not None:
+            self._disk.set(key, orjson.dumps(value), expire=self.ttl)
+
+    def close(self) -> None:
+        """Close the on-disk store, if any."""
+        if self._disk is not None:
+            self._disk.close()
+
+    def _store_in_memory(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
@@ -24,9 +24,15 @@ class AppConfig:
     search_max_retries: int = 3
     search_retry_delay: float = 1.0  # seconds
 
+    # Cache Configuration
+    cache_dir: Optional[str] = "~/.cache/ssb-search"  # None disables the on-disk cache
+    cache_ttl: float = 86400.0  # seconds
+    dev_replay: bool = False  # Development aid: replay cached LLM output across runs
+
     # Memory Configuration
     memory_limit: int = 10
     memory_token_limit: Optional[int] = None  # None means no token limit
+    session_log_path: Optional[str] = None  # JSONL log of memory entries; None disables it
 
     # Quiz Configuration
     min_quiz_options: int = 2
@@ -43,6 +49,9 @@ class AppConfig:
         if self.default_max_results < 1:
             raise ValueError("default_max_results must be at least 1")
 
+        if self.cache_ttl <= 0:
+            raise ValueError("cache_ttl must be positive")
+
         if self.memory_limit < 1:
             raise ValueError("memory_limit must be at least 1")
 
@@ -75,7 +84,11 @@ class AppConfig:
             default_max_results=int(os.getenv("DEFAULT_MAX_RESULTS", "3")),
             search_max_retries=int(os.getenv("SEARCH_MAX_RETRIES", "3")),
             search_retry_delay=float(os.getenv("SEARCH_RETRY_DELAY", "1.0")),
+            cache_dir=os.getenv("CACHE_DIR", "~/.cache/ssb-search") or None,
+            cache_ttl=float(os.getenv("CACHE_TTL", "86400")),
+            dev_replay=os.getenv("DEV_REPLAY", "").lower() in ("1", "true", "yes"),
             memory_limit=int(os.getenv("MEMORY_LIMIT", "10")),
+            session_log_path=os.getenv("SESSION_LOG_PATH") or None,
             min_quiz_options=int(os.getenv("MIN_QUIZ_OPTIONS", "2")),
             max_quiz_options=int(os.getenv("MAX_QUIZ_OPTIONS", "6")),
             max_input_retries=int(os.getenv("MAX_INPUT_RETRIES", "3")),
@@ -2,14 +2,72 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
+
+
+AGENT_INPUT_SEPARATOR = "\n---\nFocused input:\n"
+
+
+def format_agent_preamble(agent_name: str, instructions: str) -> str:
+    """
+    Format the static part of an agent prompt, which never changes between calls.
+
+    Args:
+        agent_name: Name of the agent (e.g., "Researcher", "QuizMaster")
+        instructions: Role-specific instructions for the agent
+
+    Returns:
+        Preamble string ending right before the memory section
+    """
+    return f"""You are the {agent_name} agent.
+Instructions: {instructions}
+
+Session memory (may be empty):
+"""
+
+
+def render_memory(memory: Optional[Sequence[str]]) -> str:
+    """
+    Join memory entries into the text placed in the memory section of a prompt.
+
+    Args:
+        memory: Optional sequence of memory entries from previous interactions
+
+    Returns:
+        Newline-joined entries, or an empty string when there are none
+    """
+    return "\n".join(memory) if memory else ""
+
+
+def assemble_agent_prompt(
+    preamble: str,
+    context: str,
+    memory: Optional[Sequence[str]] = None,
+    memory_rendered: Optional[str] = None,
+) -> str:
+    """
+    Join a precomputed preamble with the per-call memory and context.
+
+    Args:
+        preamble: Output of format_agent_preamble()
+        context: Current context/input for the agent
+        memory: Optional sequence of memory entries from previous interactions
+        memory_rendered: Optional output of render_memory(); takes precedence over memory
+
+    Returns:
+        Formatted prompt string
+    """
+    if memory_rendered is None:
+        memory_rendered = render_memory(memory)
+    memory_section = memory_rendered or "None yet."
+    return "".join((preamble, memory_section, AGENT_INPUT_SEPARATOR, context, "\n"))
 
 
 def format_agent_prompt(
     agent_name: str,
     instructions: str,
     context: str,
-    memory: Optional[List[str]] = None,
+    memory: Optional[Sequence[str]] = None,
 ) -> str:
     """
     Format a prompt for an agent with memory and context.
@@ -18,36 +76,46 @@ def format_agent_prompt(
         agent_name: Name of the agent (e.g., "Researcher", "QuizMaster")
         instructions: Role-specific instructions for the agent
         context: Current context/input for the agent
-        memory: Optional list of memory entries from previous interactions
+        memory: Optional sequence of memory entries from previous interactions
 
     Returns:
         Formatted prompt string
     """
-    memory_section = "\n".join(memory) if memory else "None yet."
+    return assemble_agent_prompt(
+        format_agent_preamble(agent_name, instructions), context, memory
+    )
 
-    return f"""You are the {agent_name} agent.
-Instructions: {instructions}
 
-Session memory (may be empty):
-{memory_section}
----
-Focused input:
-{context}
+def format_outline_prompt(topic: str) -> str:
+    """
+    Format the priming prompt that asks the Researcher for a subtopic outline.
+
+    Args:
+        topic: Topic to outline
+
+    Returns:
+        Formatted prompt string
+    """
+    return f"""Topic: {topic}
+Outline the key subtopics a learner should cover, as a short bullet list.
 """
 
 
-def format_researcher_prompt(topic: str, search_digest: str) -> str:
+def format_researcher_prompt(
+    topic: str, search_digest: str, outline: Optional[str] = None
+) -> str:
     """
     Format prompt for the Researcher agent.
 
     Args:
         topic: Topic to research
         search_digest: Search results digest
+        outline: Optional subtopic outline produced by a priming call
 
     Returns:
         Formatted prompt string
     """
-    return f"""Topic: {topic}
+    prompt = f"""Topic: {topic}
 Use the search digest as factual grounding. Provide:
 - A brief overview
 - 3-5 bullet points of core insights
@@ -56,6 +124,12 @@ Use the search digest as factual grounding. Provide:
 Search digest:
 {search_digest}
 """
+    if outline:
+        prompt += f"""
+Subtopic outline:
+{outline}
+"""
+    return prompt
 
 
 def format_quiz_master_prompt(study_note: str) -> str:
@@ -74,6 +148,24 @@ Study note source:
 """
 
 
+def format_quiz_master_batch_prompt(study_note: str, count: int) -> str:
+    """
+    Format prompt asking the Quiz Master for several questions in one call.
+
+    Args:
+        study_note: Study note to generate quizzes from
+        count: Number of distinct questions to generate
+
+    Returns:
+        Formatted prompt string
+    """
+    return f"""You must return valid JSON only.
+Return a JSON array of exactly {count} distinct question objects.
+Study note source:
+{study_note}
+"""
+
+
 def format_tutor_prompt(
     question: str,
     options: List[str],
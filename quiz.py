@@ -0,0 +1,214 @@
+"""Quiz data model plus the pure parsing and answer-matching helpers.
+
+Everything here is plain, fully annotated Python with no SDK objects on the hot
+path, so the module can optionally be compiled with mypyc (see README).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+import orjson
+
+LOGGER = logging.getLogger("smart-study-buddy")
+
+
+@dataclass
+class QuizItem:
+    question: str
+    options: List[str]
+    correct_answer: str
+    explanation: Optional[str] = None
+    # Lower-cased copies computed once so answer matching avoids repeated .lower() calls
+    options_lower: List[str] = field(init=False, repr=False, compare=False)
+    correct_answer_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.options_lower = [option.lower() for option in self.options]
+        self.correct_answer_lower = self.correct_answer.lower()
+
+
+def normalize_answer(
+    user_input: str,
+    options: List[str],
+    options_lower: Optional[List[str]] = None,
+) -> Optional[str]:
+    """
+    Normalize user input to match an option.
+
+    Args:
+        user_input: Raw user input
+        options: List of available options
+        options_lower: Optional precomputed lower-cased options (see QuizItem)
+
+    Returns:
+        Normalized answer matching an option, or original input
+    """
+    if not user_input:
+        return None
+
+    if user_input.isdigit():
+        idx = int(user_input) - 1
+        if 0 <= idx < len(options):
+            return options[idx]
+
+    if options_lower is None:
+        options_lower = [option.lower() for option in options]
+
+    user_input_lower = user_input.lower()
+    for option, option_lower in zip(options, options_lower):
+        if option_lower.startswith(user_input_lower):
+            return option
+    return user_input  # fallback to raw text
+
+
+def parse_quiz(payload: str) -> Optional[QuizItem]:
+    """
+    Parse quiz JSON from agent response with robust error handling.
+
+    Args:
+        payload: Raw response from quiz master agent
+
+    Returns:
+        QuizItem if parsing succeeds, None otherwise
+    """
+    if not payload:
+        return None
+
+    data = _load_quiz_json(payload)
+    if data is None:
+        return None
+    return _quiz_from_dict(data)
+
+
+def parse_quiz_list(payload: str) -> List[QuizItem]:
+    """
+    Parse a JSON array of quizzes (or a single quiz object) from an agent response.
+
+    Invalid entries and repeated questions are skipped.
+
+    Args:
+        payload: Raw response from quiz master agent
+
+    Returns:
+        List of valid QuizItems, possibly empty
+    """
+    if not payload:
+        return []
+
+    data = _load_quiz_json(payload, allow_array=True)
+    if data is None:
+        return []
+    entries = data if isinstance(data, list) else [data]
+
+    quizzes: List[QuizItem] = []
+    seen_questions = set()
+    for entry in entries:
+        quiz = _quiz_from_dict(entry)
+        if quiz and quiz.question not in seen_questions:
+            seen_questions.add(quiz.question)
+            quizzes.append(quiz)
+    return quizzes
+
+
+def _load_quiz_json(payload: str, allow_array: bool = False) -> Optional[Any]:
+    """
+    Extract and decode the JSON document embedded in an agent response.
+
+    Args:
+        payload: Raw response from quiz master agent
+        allow_array: Whether a top-level JSON array is accepted
+
+    Returns:
+        Decoded JSON value, or None if decoding fails
+    """
+    cleaned = payload.strip()
+
+    # Fast path: slice between the outermost brackets found by one find/rfind scan
+    start, end = cleaned.find("{"), cleaned.rfind("}")
+    if allow_array:
+        array_start = cleaned.find("[")
+        if array_start != -1 and (start == -1 or array_start < start):
+            start, end = array_start, cleaned.rfind("]")
+    if start != -1 and end > start:
+        try:
+            return orjson.loads(cleaned[start : end + 1])
+        except orjson.JSONDecodeError:
+            pass  # Brackets in surrounding prose; fall back to regex extraction
+
+    # Step 1: Extract JSON from markdown code blocks using regex
+    # Match JSON in markdown code blocks (```json ... ``` or ``` ... ```)
+    code_block_pattern = r"```(?:json)?\s*\n?(.*?)\n?```"
+    matches = re.findall(code_block_pattern, cleaned, re.DOTALL | re.IGNORECASE)
+    if matches:
+        # Use the last match (most likely the actual JSON)
+        cleaned = matches[-1].strip()
+    else:
+        # If no code blocks, try to find JSON boundaries
+        json_pattern = r"[\[{].*[\]}]" if allow_array else r"\{.*\}"
+        json_match = re.search(json_pattern, cleaned, re.DOTALL)
+        if json_match:
+            cleaned = json_match.group(0).strip()
+
+    # Step 2: Parse JSON
+    try:
+        return orjson.loads(cleaned)
+    except orjson.JSONDecodeError as exc:
+        LOGGER.error("Quiz JSON parsing failed: %s\nPayload was:\n%s", exc, payload)
+        return None
+
+
+def _quiz_from_dict(data: Any) -> Optional[QuizItem]:
+    """
+    Validate a decoded quiz object and build a QuizItem from it.
+
+    Args:
+        data: Decoded JSON value for a single quiz
+
+    Returns:
+        QuizItem if validation succeeds, None otherwise
+    """
+    if not isinstance(data, dict):
+        LOGGER.error("Quiz JSON must be an object: %s", data)
+        return None
+
+    # Step 3: Validate and extract fields
+    question = data.get("question")
+    options = data.get("options", [])
+    answer = data.get("correct_answer")
+    explanation = data.get("explanation")
+
+    # Validate required fields
+    if not question or not isinstance(question, str):
+        LOGGER.error("Quiz JSON missing or invalid 'question' field: %s", data)
+        return None
+
+    if not options or not isinstance(options, list):
+        LOGGER.error("Quiz JSON missing or invalid 'options' field: %s", data)
+        return None
+
+    if len(options) < 2:
+        LOGGER.error("Quiz JSON 'options' must have at least 2 items: %s", data)
+        return None
+
+    if not answer or not isinstance(answer, str):
+        LOGGER.error("Quiz JSON missing or invalid 'correct_answer' field: %s", data)
+        return None
+
+    # Validate that correct_answer is in options
+    if answer not in options:
+        LOGGER.warning(
+            "Correct answer '%s' not found in options. Using first option as fallback.",
+            answer,
+        )
+        answer = options[0]
+
+    return QuizItem(
+        question=question,
+        options=options,
+        correct_answer=answer,
+        explanation=explanation,
+    )
@@ -13,23 +13,42 @@ Run locally:
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import atexit
+import functools
+import hashlib
 import logging
-import re
+import os
+import sys
+import threading
 import time
-from dataclasses import dataclass
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Dict, List, Optional, Sequence, Tuple
 
 from duckduckgo_search import DDGS
 import google.generativeai as genai
+import orjson
 
+try:
+    from aioconsole import ainput
+except ImportError:  # pragma: no cover - optional dependency
+    ainput = None
+
+from cache import ResponseCache, make_cache_key
 from config import AppConfig
 from prompts import (
-    format_agent_prompt,
+    assemble_agent_prompt,
+    format_agent_preamble,
+    format_outline_prompt,
+    format_quiz_master_batch_prompt,
     format_quiz_master_prompt,
     format_researcher_prompt,
     format_tutor_prompt,
+    render_memory,
 )
+from quiz import QuizItem, normalize_answer, parse_quiz, parse_quiz_list
 
 # ----------------------------------------------------------------------------
 # Configuration & logging
@@ -46,6 +65,10 @@ LOGGER = logging.getLogger("smart-study-buddy")
 # ----------------------------------------------------------------------------
 # Tooling layer
 # ----------------------------------------------------------------------------
+class SearchError(RuntimeError):
+    """Raised when a web search fails after all retries."""
+
+
 @dataclass
 class SearchTool:
     """Simple wrapper around DuckDuckGo Search to serve as an agent tool."""
@@ -53,6 +76,23 @@ class SearchTool:
     max_results: int
     max_retries: int
     retry_delay: float
+    cache: Optional[ResponseCache] = None
+    _sessions: threading.local = field(
+        default_factory=threading.local, init=False, repr=False, compare=False
+    )
+
+    def _client(self) -> DDGS:
+        """
+        Return this thread's persistent DDGS session, opening it on first use.
+
+        DDGS throttles back-to-back requests on one instance, so each worker thread
+        keeps its own session and concurrent sub-queries are not serialized.
+        """
+        ddgs = getattr(self._sessions, "ddgs", None)
+        if ddgs is None:
+            ddgs = self._sessions.ddgs = DDGS()
+            atexit.register(ddgs.__exit__, None, None, None)
+        return ddgs
 
     def run(self, query: str) -> str:
         """
@@ -67,21 +107,87 @@ class SearchTool:
         if not query:
             return "No query provided."
 
+        try:
+            rows = self._search_rows(query)
+        except SearchError as err:
+            return str(err)
+        return self.format_rows(rows)
+
+    async def asearch_many(self, queries: List[str]) -> List[Tuple[str, str]]:
+        """
+        Run several searches concurrently and merge their de-duplicated rows.
+
+        Args:
+            queries: Search query strings
+
+        Returns:
+            Merged list of (title, body) pairs, possibly empty
+
+        Raises:
+            SearchError: If every sub-query fails
+        """
+        queries = [query for query in queries if query]
+        if not queries:
+            return []
+
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._search_rows, query) for query in queries),
+            return_exceptions=True,
+        )
+
+        merged: List[Tuple[str, str]] = []
+        seen = set()
+        errors: List[SearchError] = []
+        for result in results:
+            if isinstance(result, SearchError):
+                errors.append(result)
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            for title, body in result:
+                key = (title, body[:80])
+                if key not in seen:
+                    seen.add(key)
+                    merged.append((title, body))
+
+        if not merged and len(errors) == len(queries):
+            raise errors[0]
+        return merged
+
+    def _search_rows(self, query: str) -> List[Tuple[str, str]]:
+        """
+        Fetch (title, body) rows for a query, using the cache when available.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            List of (title, body) pairs, possibly empty
+
+        Raises:
+            SearchError: If the search fails or all retries are exhausted
+        """
+        cache_key = make_cache_key("search", query, str(self.max_results))
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                LOGGER.info("[Tool] Cache hit for '%s'", query)
+                return [(title, body) for title, body in cached]
+
         LOGGER.info("[Tool] Searching web for '%s' (top %d results)", query, self.max_results)
 
         last_error: Optional[Exception] = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                snippets: List[str] = []
-                with DDGS() as ddgs:
-                    for row in ddgs.text(query, max_results=self.max_results):
-                        body = row.get("body") or ""
-                        title = row.get("title") or "Untitled"
-                        snippets.append(f"- {title}: {body}")
+                rows: List[Tuple[str, str]] = []
+                for row in self._client().text(query, max_results=self.max_results):
+                    body = row.get("body") or ""
+                    title = row.get("title") or "Untitled"
+                    rows.append((title, body))
 
-                if snippets:
-                    return "\n".join(snippets)
-                return "No public snippets were found."
+                if rows and self.cache is not None:
+                    self.cache.set(cache_key, rows)
+                return rows
 
             except (ConnectionError, TimeoutError) as err:
                 last_error = err
@@ -100,18 +206,38 @@ class SearchTool:
 
             except Exception as err:  # pragma: no cover - network variances
                 LOGGER.warning("DuckDuckGo search failed with unexpected error: %s", err)
-                return f"Search failed: {err}"
+                raise SearchError(f"Search failed: {err}") from err
 
         # If we get here, all retries failed
         error_msg = f"Search failed after {self.max_retries} attempts"
         if last_error:
             error_msg += f": {last_error}"
-        return error_msg
+        raise SearchError(error_msg)
+
+    @staticmethod
+    def format_rows(rows: List[Tuple[str, str]]) -> str:
+        """Render (title, body) rows as the bullet digest given to the Researcher."""
+        if not rows:
+            return "No public snippets were found."
+        return "\n".join(f"- {title}: {body}" for title, body in rows)
 
 
 # ----------------------------------------------------------------------------
 # Base agent abstraction
 # ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=16)
+def _get_model(model_name: str, response_mime_type: str) -> genai.GenerativeModel:
+    """
+    Return a shared GenerativeModel for the given model and response MIME type.
+
+    GenerativeModel holds no per-call state, so agents with the same settings reuse one.
+    """
+    return genai.GenerativeModel(
+        model_name=model_name,
+        generation_config={"response_mime_type": response_mime_type},
+    )
+
+
 @dataclass
 class Agent:
     """Wrapper around a GenerativeModel with role-specific instructions."""
@@ -122,18 +248,23 @@ class Agent:
     response_mime_type: str = "text/plain"
 
     def __post_init__(self) -> None:
-        self._model = genai.GenerativeModel(
-            model_name=self.model_name,
-            generation_config={"response_mime_type": self.response_mime_type},
-        )
+        self._model = _get_model(self.model_name, self.response_mime_type)
+        self._preamble = format_agent_preamble(self.name, self.instructions)
 
-    def run(self, context: str, memory: Optional[List[str]] = None) -> str:
+    async def arun(
+        self,
+        context: str,
+        memory: Optional[Sequence[str]] = None,
+        *,
+        memory_rendered: Optional[str] = None,
+    ) -> str:
         """
         Execute the agent with given context and memory.
 
         Args:
             context: Current context/input for the agent
-            memory: Optional list of memory entries from previous interactions
+            memory: Optional sequence of memory entries from previous interactions
+            memory_rendered: Optional pre-joined memory (see prompts.render_memory)
 
         Returns:
             Agent response text
@@ -141,33 +272,55 @@ class Agent:
         Raises:
             Exception: If the agent call fails
         """
-        compiled_prompt = format_agent_prompt(
-            agent_name=self.name,
-            instructions=self.instructions,
-            context=context,
-            memory=memory,
+        compiled_prompt = assemble_agent_prompt(
+            self._preamble, context, memory, memory_rendered
         )
 
         try:
-            response = self._model.generate_content(compiled_prompt)
+            response = await self._model.generate_content_async(compiled_prompt)
         except Exception as exc:  # pragma: no cover - SDK surface
             LOGGER.error("%s agent call failed: %s", self.name, exc)
             raise
 
         return (response.text or "").strip()
 
+    async def arun_stream(
+        self,
+        context: str,
+        memory: Optional[Sequence[str]] = None,
+        *,
+        memory_rendered: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Execute the agent and yield response text as it is generated.
+
+        Args:
+            context: Current context/input for the agent
+            memory: Optional sequence of memory entries from previous interactions
+            memory_rendered: Optional pre-joined memory (see prompts.render_memory)
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            Exception: If the agent call fails
+        """
+        compiled_prompt = assemble_agent_prompt(
+            self._preamble, context, memory, memory_rendered
+        )
+
+        try:
+            response = await self._model.generate_content_async(compiled_prompt, stream=True)
+            async for chunk in response:
+                yield chunk.text
+        except Exception as exc:  # pragma: no cover - SDK surface
+            LOGGER.error("%s agent call failed: %s", self.name, exc)
+            raise
+
 
 # ----------------------------------------------------------------------------
 # Pipeline logic
 # ----------------------------------------------------------------------------
-@dataclass
-class QuizItem:
-    question: str
-    options: List[str]
-    correct_answer: str
-    explanation: Optional[str] = None
-
-
 class SmartStudyBuddy:
     """Coordinates the tool + agents to deliver a study session."""
 
@@ -175,6 +328,7 @@ class SmartStudyBuddy:
         self,
         config: AppConfig,
         search_tool: Optional[SearchTool] = None,
+        cache: Optional[ResponseCache] = None,
     ) -> None:
         """
         Initialize Smart Study Buddy with configuration.
@@ -182,9 +336,21 @@ class SmartStudyBuddy:
         Args:
             config: Application configuration
             search_tool: Optional search tool instance (uses config defaults if not provided)
+            cache: Optional development cache used to replay QuizMaster responses
+                for identical notes (enabled from the CLI via DEV_REPLAY)
         """
         self.config = config
-        self.memory: List[str] = []
+        self.cache = cache
+        self._study_note_cache: Dict[str, str] = {}
+        # Single writer thread keeps session-log appends ordered and off the hot path
+        self._log_executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="ssb-session-log")
+            if config.session_log_path
+            else None
+        )
+        # Bounded ring buffer keeps prompts small without copying on every append
+        self.memory: Deque[str] = deque(maxlen=config.memory_limit)
+        self._memory_rendered: Optional[str] = None
         self.search_tool = search_tool or SearchTool(
             max_results=config.default_max_results,
             max_retries=config.search_max_retries,
@@ -202,9 +368,10 @@ class SmartStudyBuddy:
         self.quiz_master = Agent(
             name="QuizMaster",
             instructions=(
-                "Create a single multiple-choice question based on the study note."
-                " Respond with strict JSON containing keys question, options (list),"
-                " correct_answer, explanation."
+                "Create multiple-choice questions based on the study note."
+                " Each question is a strict JSON object containing keys question,"
+                " options (list), correct_answer, explanation. Return a single object"
+                " unless asked for an array of several questions."
             ),
             model_name=config.gemini_model,
             response_mime_type="application/json",
@@ -227,31 +394,72 @@ class SmartStudyBuddy:
             topic: Topic to study
             questions: Number of quiz questions to generate
         """
-        study_note = self._generate_study_note(topic)
+        asyncio.run(self.ainteractive_session(topic=topic, questions=questions))
+
+    async def ainteractive_session(self, topic: str, questions: int = 1) -> None:
+        """
+        Async study session that batches quiz generation into one QuizMaster call.
+
+        If the batch comes back short, the missing questions are prefetched one at a
+        time while the learner answers the current one.
+
+        Args:
+            topic: Topic to study
+            questions: Number of quiz questions to generate
+        """
+        study_note = await self._agenerate_study_note(topic)
         LOGGER.info("Study note ready. Generating %d quiz question(s)...", questions)
 
         correct = 0
-        for idx in range(1, questions + 1):
-            quiz = self._generate_quiz(study_note)
-            if not quiz:
-                LOGGER.error("Quiz generation failed. Aborting session.")
-                return
-
-            print(f"\n==== Quiz {idx} / {questions} ====")
-            print(quiz.question)
-            for option_idx, option in enumerate(quiz.options, start=1):
-                print(f"  {option_idx}. {option}")
+        # One QuizMaster call for the whole session; per-question calls only top up a short batch
+        pending_quizzes: Deque[QuizItem] = deque()
+        if questions > 0:
+            pending_quizzes.extend(await self._agenerate_quiz_batch(study_note, questions))
+        next_quiz_task: Optional[asyncio.Task] = None
+        try:
+            for idx in range(1, questions + 1):
+                if pending_quizzes:
+                    quiz = pending_quizzes.popleft()
+                else:
+                    if next_quiz_task is None:
+                        next_quiz_task = asyncio.create_task(
+                            self._agenerate_quiz(study_note, ordinal=idx)
+                        )
+                    quiz = await next_quiz_task
+                    next_quiz_task = None
+                if not quiz:
+                    LOGGER.error("Quiz generation failed. Aborting session.")
+                    return
+                # Remember at ask time so a prefetched quiz never leaks into earlier prompts
+                self._remember(f"Quiz::{quiz.question}")
+
+                print(f"\n==== Quiz {idx} / {questions} ====")
+                print(quiz.question)
+                for option_idx, option in enumerate(quiz.options, start=1):
+                    print(f"  {option_idx}. {option}")
+
+                # Overlap the next QuizMaster round-trip with the learner's think time
+                if idx < questions and not pending_quizzes:
+                    next_quiz_task = asyncio.create_task(
+                        self._agenerate_quiz(study_note, ordinal=idx + 1)
+                    )
 
-            user_answer = self._get_user_answer(quiz.options)
-            if user_answer is None:  # User quit
-                break
+                user_answer = await self._aget_user_answer(quiz.options)
+                if user_answer is None:  # User quit
+                    break
 
-            normalized = self._normalize_answer(user_answer, quiz.options)
-            feedback = self._grade_and_feedback(quiz, normalized, study_note)
-            print("\nFeedback:\n" + feedback)
+                normalized = self._normalize_answer(
+                    user_answer, quiz.options, quiz.options_lower
+                )
+                print("\nFeedback:")
+                await self._agrade_and_feedback(quiz, normalized, study_note)
+                print()
 
-            if normalized and normalized.lower() == quiz.correct_answer.lower():
-                correct += 1
+                if normalized and normalized.lower() == quiz.correct_answer_lower:
+                    correct += 1
+        finally:
+            if next_quiz_task is not None:
+                next_quiz_task.cancel()
 
         if questions:
             print(
@@ -262,19 +470,85 @@ class SmartStudyBuddy:
     # -------------------------- internals ----------------------------
     def _remember(self, entry: str) -> None:
         """
-        Add an entry to memory, maintaining the configured limit.
+        Add an entry to memory; the oldest entry drops out once the limit is reached.
+
+        When a session log is configured, the entry is also appended to it in the background.
 
         Args:
             entry: Memory entry to add
         """
         self.memory.append(entry)
-        # Keep memory bounded to avoid prompt bloat
-        if len(self.memory) > self.config.memory_limit:
-            self.memory = self.memory[-self.config.memory_limit :]
+        self._memory_rendered = None
+        if self._log_executor is not None:
+            self._log_executor.submit(self._append_session_log, entry, time.time())
+
+    def _render_memory(self) -> str:
+        """
+        Return memory joined for prompts, reusing the result until memory changes.
+
+        Returns:
+            Rendered memory shared by every agent call in the current turn
+        """
+        if self._memory_rendered is None:
+            self._memory_rendered = render_memory(self.memory)
+        return self._memory_rendered
+
+    def _append_session_log(self, entry: str, timestamp: float) -> None:
+        """
+        Append a memory entry to the JSONL session log (runs on the log executor).
+
+        Args:
+            entry: Memory entry to record
+            timestamp: Time the entry was remembered (seconds since the epoch)
+        """
+        path = os.path.expanduser(self.config.session_log_path)
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "ab") as handle:
+                handle.write(orjson.dumps({"timestamp": timestamp, "entry": entry}) + b"\n")
+        except OSError as err:
+            LOGGER.warning("Could not write session log %s: %s", path, err)
+
+    def close(self) -> None:
+        """Flush pending session-log writes and release background resources."""
+        if self._log_executor is not None:
+            self._log_executor.shutdown(wait=True)
+
+    @staticmethod
+    def _search_queries(topic: str) -> List[str]:
+        """
+        Build the targeted query variants used to ground a study note.
+
+        Args:
+            topic: Topic to research
+
+        Returns:
+            Search queries to run concurrently
+        """
+        return [topic, f"{topic} examples", f"{topic} common mistakes"]
+
+    async def _asearch_digest(self, topic: str) -> Tuple[str, bool]:
+        """
+        Run the topic searches and render them as a digest for the Researcher.
+
+        Args:
+            topic: Topic to research
+
+        Returns:
+            Tuple of (digest, grounded); grounded is False when no snippets came back
+        """
+        try:
+            rows = await self.search_tool.asearch_many(self._search_queries(topic))
+        except SearchError as err:
+            return str(err), False
+        return SearchTool.format_rows(rows), bool(rows)
 
-    def _generate_study_note(self, topic: str) -> str:
+    async def _agenerate_study_note(self, topic: str) -> str:
         """
-        Generate a study note for the given topic.
+        Generate a study note, priming the Researcher while the web searches run.
+
+        Only notes grounded in search results are cached, so a failed search is
+        retried on the next request for the topic.
 
         Args:
             topic: Topic to research
@@ -282,36 +556,157 @@ class SmartStudyBuddy:
         Returns:
             Generated study note
         """
-        search_digest = self.search_tool.run(topic)
-        context = format_researcher_prompt(topic=topic, search_digest=search_digest)
+        note = self._lookup_study_note(topic)
+        if note is None:
+            search_task = asyncio.create_task(self._asearch_digest(topic))
+            prime_task = asyncio.create_task(
+                self.researcher.arun(
+                    format_outline_prompt(topic=topic), memory_rendered=self._render_memory()
+                )
+            )
+            (search_digest, grounded), outline = await asyncio.gather(search_task, prime_task)
+            context = format_researcher_prompt(
+                topic=topic, search_digest=search_digest, outline=outline
+            )
+
+            note = await self.researcher.arun(context, memory_rendered=self._render_memory())
+            if grounded and note.strip():
+                self._store_study_note(topic, note)
+            else:
+                LOGGER.info("[Cache] Not caching ungrounded study note for %s", topic)
 
-        note = self.researcher.run(context, self.memory)
         self._remember(f"StudyNote::{note}")
         return note
 
-    def _generate_quiz(self, study_note: str) -> Optional[QuizItem]:
+    @staticmethod
+    def _study_note_key(topic: str) -> str:
+        """Return the cache key for a topic, ignoring case and surrounding whitespace."""
+        return hashlib.sha1(topic.lower().strip().encode("utf-8")).hexdigest()
+
+    def _lookup_study_note(self, topic: str) -> Optional[str]:
+        """
+        Return a previously generated study note for the topic, if any.
+
+        Args:
+            topic: Topic to look up
+
+        Returns:
+            Cached study note, or None on a miss (empty notes count as misses)
+        """
+        key = self._study_note_key(topic)
+        note = self._study_note_cache.get(key)
+        if not note and self.cache is not None:
+            note = self.cache.get(make_cache_key("study-note", key))
+            if note:
+                self._study_note_cache[key] = note
+
+        if not note:
+            return None
+        LOGGER.info("[Cache] Study note hit for %s", topic)
+        return note
+
+    def _store_study_note(self, topic: str, note: str) -> None:
+        """
+        Cache a generated study note in-process and, when dev replay is enabled, on disk.
+
+        Args:
+            topic: Topic the note was generated for
+            note: Generated study note
+        """
+        key = self._study_note_key(topic)
+        self._study_note_cache[key] = note
+        if self.cache is not None:
+            self.cache.set(make_cache_key("study-note", key), note)
+
+    async def _agenerate_quiz(
+        self, study_note: str, ordinal: Optional[int] = None
+    ) -> Optional[QuizItem]:
         """
         Generate a quiz question from a study note.
 
+        The quiz is not added to memory here; callers remember it when it is asked.
+
         Args:
             study_note: Study note to generate quiz from
+            ordinal: Optional question number; enables cache replay when set
 
         Returns:
             QuizItem if successful, None otherwise
         """
+        cache_key = self._quiz_cache_key(study_note, ordinal)
+        raw_response = self.cache.get(cache_key) if cache_key else None
+        if raw_response is not None:
+            # Replays are not written back, so the entry still expires after its TTL
+            return self._accept_quiz(raw_response, cache_key=None)
+
         context = format_quiz_master_prompt(study_note=study_note)
+        raw_response = await self.quiz_master.arun(
+            context, memory_rendered=self._render_memory()
+        )
+        return self._accept_quiz(raw_response, cache_key)
+
+    async def _agenerate_quiz_batch(self, study_note: str, count: int) -> List[QuizItem]:
+        """
+        Generate several distinct quiz questions with a single QuizMaster call.
+
+        Quizzes are not added to memory here; callers remember each one as it is asked.
+
+        Args:
+            study_note: Study note to generate quizzes from
+            count: Number of questions to request
 
-        raw_response = self.quiz_master.run(context, self.memory)
+        Returns:
+            Parsed quiz items (may be fewer than requested)
+        """
+        cache_key = self._quiz_batch_cache_key(study_note, count)
+        raw_response = self.cache.get(cache_key) if cache_key else None
+        if raw_response is not None:
+            # Replays are not written back, so the entry still expires after its TTL
+            return self._accept_quiz_batch(raw_response, count, cache_key=None)
+
+        context = format_quiz_master_batch_prompt(study_note=study_note, count=count)
+        raw_response = await self.quiz_master.arun(
+            context, memory_rendered=self._render_memory()
+        )
+        return self._accept_quiz_batch(raw_response, count, cache_key)
+
+    def _quiz_batch_cache_key(self, study_note: str, count: int) -> Optional[str]:
+        """Return the QuizMaster batch cache key, or None when caching is disabled."""
+        if self.cache is None:
+            return None
+        return make_cache_key("quiz-batch", study_note, str(count))
+
+    def _accept_quiz_batch(
+        self, raw_response: str, count: int, cache_key: Optional[str]
+    ) -> List[QuizItem]:
+        """Parse a QuizMaster batch payload and cache it if it yielded any quizzes."""
+        quizzes = self._parse_quiz_list(raw_response)[:count]
+        if len(quizzes) < count:
+            LOGGER.warning(
+                "QuizMaster returned %d of %d requested questions.", len(quizzes), count
+            )
+        if quizzes and cache_key:
+            self.cache.set(cache_key, raw_response)
+        return quizzes
+
+    def _quiz_cache_key(self, study_note: str, ordinal: Optional[int]) -> Optional[str]:
+        """Return the QuizMaster cache key, or None when caching does not apply."""
+        if self.cache is None or ordinal is None:
+            return None
+        return make_cache_key("quiz", study_note, str(ordinal))
+
+    def _accept_quiz(self, raw_response: str, cache_key: Optional[str]) -> Optional[QuizItem]:
+        """Parse a QuizMaster payload and cache it if valid."""
         quiz = self._parse_quiz(raw_response)
-        if quiz:
-            self._remember(f"Quiz::{quiz.question}")
+        if quiz and cache_key:
+            self.cache.set(cache_key, raw_response)
         return quiz
 
-    def _grade_and_feedback(
+    async def _agrade_and_feedback(
         self, quiz: QuizItem, user_answer: Optional[str], study_note: str
     ) -> str:
         """
-        Grade user answer and generate feedback.
+        Grade user answer and stream feedback to stdout as it is generated.
 
         Args:
             quiz: Quiz item with question and correct answer
@@ -329,13 +724,21 @@ class SmartStudyBuddy:
             study_note=study_note,
         )
 
-        feedback = self.tutor.run(context, self.memory)
+        chunks: List[str] = []
+        async for chunk in self.tutor.arun_stream(
+            context, memory_rendered=self._render_memory()
+        ):
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+            chunks.append(chunk)
+
+        feedback = "".join(chunks).strip()
         self._remember(f"Feedback::{feedback}")
         return feedback
 
-    def _get_user_answer(self, options: List[str]) -> Optional[str]:
+    async def _aget_user_answer(self, options: List[str]) -> Optional[str]:
         """
-        Get and validate user answer with retry logic.
+        Get and validate user answer with retry logic, without blocking the event loop.
 
         Args:
             options: List of available answer options
@@ -344,8 +747,10 @@ class SmartStudyBuddy:
             User's answer string, or None if user quits
         """
         for attempt in range(1, self.config.max_input_retries + 1):
-            user_input = input(
-                f"Your answer (number or text, 'q' to quit) [{attempt}/{self.config.max_input_retries}]: "
+            user_input = (
+                await self._ainput(
+                    f"Your answer (number or text, 'q' to quit) [{attempt}/{self.config.max_input_retries}]: "
+                )
             ).strip()
 
             if not user_input:
@@ -378,105 +783,51 @@ class SmartStudyBuddy:
         return None
 
     @staticmethod
-    def _normalize_answer(user_input: str, options: List[str]) -> Optional[str]:
+    async def _ainput(prompt: str) -> str:
         """
-        Normalize user input to match an option.
+        Read a line from stdin while the event loop keeps servicing other tasks.
 
-        Args:
-            user_input: Raw user input
-            options: List of available options
-
-        Returns:
-            Normalized answer matching an option, or original input
-        """
-        if not user_input:
-            return None
-
-        if user_input.isdigit():
-            idx = int(user_input) - 1
-            if 0 <= idx < len(options):
-                return options[idx]
-
-        user_input_lower = user_input.lower()
-        for option in options:
-            if option.lower().startswith(user_input_lower):
-                return option
-        return user_input  # fallback to raw text
-
-    @staticmethod
-    def _parse_quiz(payload: str) -> Optional[QuizItem]:
-        """
-        Parse quiz JSON from agent response with robust error handling.
+        Uses aioconsole when installed, otherwise a blocking input() on a daemon thread.
+        The thread is never joined, so Ctrl-C during the prompt exits straight away
+        instead of waiting on input() the way the default executor's shutdown would.
 
         Args:
-            payload: Raw response from quiz master agent
+            prompt: Prompt text to display
 
         Returns:
-            QuizItem if parsing succeeds, None otherwise
+            Raw line entered by the user
         """
-        if not payload:
-            return None
+        if ainput is not None:
+            return await ainput(prompt)
 
-        # Step 1: Extract JSON from markdown code blocks using regex
-        cleaned = payload.strip()
-
-        # Match JSON in markdown code blocks (```json ... ``` or ``` ... ```)
-        code_block_pattern = r"```(?:json)?\s*\n?(.*?)\n?```"
-        matches = re.findall(code_block_pattern, cleaned, re.DOTALL | re.IGNORECASE)
-        if matches:
-            # Use the last match (most likely the actual JSON)
-            cleaned = matches[-1].strip()
-        else:
-            # If no code blocks, try to find JSON object boundaries
-            json_pattern = r"\{.*\}"
-            json_match = re.search(json_pattern, cleaned, re.DOTALL)
-            if json_match:
-                cleaned = json_match.group(0).strip()
-
-        # Step 2: Parse JSON
-        try:
-            data = json.loads(cleaned)
-        except json.JSONDecodeError as exc:
-            LOGGER.error("Quiz JSON parsing failed: %s\nPayload was:\n%s", exc, payload)
-            return None
-
-        # Step 3: Validate and extract fields
-        question = data.get("question")
-        options = data.get("options", [])
-        answer = data.get("correct_answer")
-        explanation = data.get("explanation")
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
 
-        # Validate required fields
-        if not question or not isinstance(question, str):
-            LOGGER.error("Quiz JSON missing or invalid 'question' field: %s", data)
-            return None
-
-        if not options or not isinstance(options, list):
-            LOGGER.error("Quiz JSON missing or invalid 'options' field: %s", data)
-            return None
-
-        if len(options) < 2:
-            LOGGER.error("Quiz JSON 'options' must have at least 2 items: %s", data)
-            return None
+        def _deliver(result: Optional[str], error: Optional[BaseException]) -> None:
+            if future.done():  # Session already cancelled
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result or "")
 
-        if not answer or not isinstance(answer, str):
-            LOGGER.error("Quiz JSON missing or invalid 'correct_answer' field: %s", data)
-            return None
+        def _read() -> None:
+            try:
+                line, error = input(prompt), None
+            except BaseException as err:  # EOFError etc. surface in the awaiting task
+                line, error = None, err
+            try:
+                loop.call_soon_threadsafe(_deliver, line, error)
+            except RuntimeError:  # Event loop already closed
+                pass
 
-        # Validate that correct_answer is in options
-        if answer not in options:
-            LOGGER.warning(
-                "Correct answer '%s' not found in options. Using first option as fallback.",
-                answer,
-            )
-            answer = options[0]
+        threading.Thread(target=_read, name="ssb-input", daemon=True).start()
+        return await future
 
-        return QuizItem(
-            question=question,
-            options=options,
-            correct_answer=answer,
-            explanation=explanation,
-        )
+    # Pure parsing/matching helpers live in quiz.py so they can be compiled with mypyc
+    _normalize_answer = staticmethod(normalize_answer)
+    _parse_quiz = staticmethod(parse_quiz)
+    _parse_quiz_list = staticmethod(parse_quiz_list)
 
 
 # ----------------------------------------------------------------------------
@@ -492,6 +843,11 @@ def parse_args() -> argparse.Namespace:
         default=3,
         help="How many search results to fetch for grounding context.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk search cache.",
+    )
     return parser.parse_args()
 
 
@@ -504,7 +860,10 @@ def main() -> None:
         LOGGER.error(str(e))
         raise
 
-    # Configure Gemini API
+    # Configure Gemini API. The transport is left at the SDK default on purpose: gRPC
+    # (HTTP/2, multiplexed) for sync calls and grpc_asyncio for the async session, each
+    # backed by one process-wide client that every agent shares via _get_model().
+    # Forcing transport="grpc" would hand the async client a sync transport.
     genai.configure(api_key=config.gemini_api_key)
 
     args = parse_args()
@@ -516,14 +875,43 @@ def main() -> None:
     if args.max_results:
         config.default_max_results = args.max_results
 
+    search_cache = None
+    if not args.no_cache:
+        search_cache = ResponseCache(directory=config.cache_dir, ttl=config.cache_ttl)
+
+    # Replaying LLM output is a development aid only; learners get fresh quizzes by default
+    replay_cache = None
+    if config.dev_replay:
+        replay_cache = search_cache or ResponseCache(
+            directory=config.cache_dir, ttl=config.cache_ttl
+        )
+
     search_tool = SearchTool(
         max_results=config.default_max_results,
         max_retries=config.search_max_retries,
         retry_delay=config.search_retry_delay,
+        cache=search_cache,
     )
 
-    buddy = SmartStudyBuddy(config=config, search_tool=search_tool)
-    buddy.interactive_session(topic=topic, questions=max(1, args.questions))
+    buddy = SmartStudyBuddy(config=config, search_tool=search_tool, cache=replay_cache)
+    interrupted = False
+    try:
+        buddy.interactive_session(topic=topic, questions=max(1, args.questions))
+    except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        buddy.close()
+        if search_cache is not None:
+            search_cache.close()
+        if replay_cache is not None and replay_cache is not search_cache:
+            replay_cache.close()
+
+    if interrupted:
+        # A daemon input() thread may still hold the stdin lock, which aborts interpreter
+        # finalization; resources are closed above, so skip it and exit right away.
+        print("\nSession interrupted.", flush=True)
+        sys.stderr.flush()
+        os._exit(130)
 
 
 if __name__ == "__main__":
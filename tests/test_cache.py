@@ -0,0 +1,49 @@
+"""Tests for response caching."""
+
+from cache import ResponseCache, make_cache_key
+
+
+class TestMakeCacheKey:
+    """Test cache key construction."""
+
+    def test_key_is_stable(self):
+        """Test identical parts produce identical keys."""
+        assert make_cache_key("topic", "3") == make_cache_key("topic", "3")
+
+    def test_key_separates_parts(self):
+        """Test part boundaries are part of the key."""
+        assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
+
+class TestResponseCache:
+    """Test ResponseCache class."""
+
+    def test_memory_only_roundtrip(self):
+        """Test values round-trip without a disk store."""
+        cache = ResponseCache()
+        assert cache.get("missing") is None
+        cache.set("key", ["- A: a"])
+        assert cache.get("key") == ["- A: a"]
+
+    def test_memory_lru_eviction(self):
+        """Test least recently used entries are evicted first."""
+        cache = ResponseCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_disk_persists_across_instances(self, tmp_path):
+        """Test entries survive in the on-disk store."""
+        cache = ResponseCache(directory=str(tmp_path))
+        cache.set("key", {"question": "Q?"})
+        cache.close()
+
+        reopened = ResponseCache(directory=str(tmp_path))
+        try:
+            assert reopened.get("key") == {"question": "Q?"}
+        finally:
+            reopened.close()
@@ -26,6 +26,13 @@ class TestAppConfig:
             assert config.default_max_results == 3
             assert config.memory_limit == 10
 
+    def test_from_env_dev_replay(self):
+        """Test DEV_REPLAY opts into replaying cached LLM output."""
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key", "DEV_REPLAY": "1"}):
+            assert AppConfig.from_env().dev_replay is True
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key", "DEV_REPLAY": ""}):
+            assert AppConfig.from_env().dev_replay is False
+
     def test_from_env_missing_api_key(self):
         """Test that missing API key raises EnvironmentError."""
         with patch.dict(os.environ, {}, clear=True):
@@ -47,6 +54,10 @@ class TestAppConfig:
         with pytest.raises(ValueError, match="default_max_results must be at least 1"):
             AppConfig(gemini_api_key="test-key", default_max_results=0)
 
+        # Invalid: non-positive cache_ttl
+        with pytest.raises(ValueError, match="cache_ttl must be positive"):
+            AppConfig(gemini_api_key="test-key", cache_ttl=0)
+
         # Invalid: negative memory_limit
         with pytest.raises(ValueError, match="memory_limit must be at least 1"):
             AppConfig(gemini_api_key="test-key", memory_limit=0)
@@ -70,7 +81,11 @@ class TestAppConfig:
         assert config.default_max_results == 3
         assert config.search_max_retries == 3
         assert config.search_retry_delay == 1.0
+        assert config.cache_dir == "~/.cache/ssb-search"
+        assert config.cache_ttl == 86400.0
+        assert config.dev_replay is False
         assert config.memory_limit == 10
+        assert config.session_log_path is None
         assert config.min_quiz_options == 2
         assert config.max_quiz_options == 6
         assert config.max_input_retries == 3
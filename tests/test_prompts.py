@@ -1,10 +1,14 @@
 """Tests for prompt templates."""
 
 from prompts import (
+    assemble_agent_prompt,
+    format_agent_preamble,
     format_agent_prompt,
+    format_outline_prompt,
     format_quiz_master_prompt,
     format_researcher_prompt,
     format_tutor_prompt,
+    render_memory,
 )
 
 
@@ -36,6 +40,23 @@ class TestPromptTemplates:
         assert "TestAgent" in prompt
         assert "None yet." in prompt
 
+    def test_assemble_agent_prompt_matches_format(self):
+        """Test a precomputed preamble yields the same prompt as format_agent_prompt."""
+        preamble = format_agent_preamble("TestAgent", "Do something")
+        for memory in (["Memory 1", "Memory 2"], None):
+            assert assemble_agent_prompt(preamble, "Test context", memory) == format_agent_prompt(
+                agent_name="TestAgent",
+                instructions="Do something",
+                context="Test context",
+                memory=memory,
+            )
+
+    def test_render_memory(self):
+        """Test memory rendering joins entries and handles empty memory."""
+        assert render_memory(["Memory 1", "Memory 2"]) == "Memory 1\nMemory 2"
+        assert render_memory(None) == ""
+        assert render_memory([]) == ""
+
     def test_format_researcher_prompt(self):
         """Test researcher prompt formatting."""
         prompt = format_researcher_prompt(
@@ -44,6 +65,22 @@ class TestPromptTemplates:
         )
         assert "Photosynthesis" in prompt
         assert "Search results here" in prompt
+        assert "Subtopic outline" not in prompt
+
+    def test_format_researcher_prompt_with_outline(self):
+        """Test researcher prompt formatting with a priming outline."""
+        prompt = format_researcher_prompt(
+            topic="Photosynthesis",
+            search_digest="Search results here",
+            outline="- Light reactions",
+        )
+        assert "Subtopic outline" in prompt
+        assert "- Light reactions" in prompt
+
+    def test_format_outline_prompt(self):
+        """Test outline prompt formatting."""
+        prompt = format_outline_prompt(topic="Photosynthesis")
+        assert "Photosynthesis" in prompt
 
     def test_format_quiz_master_prompt(self):
         """Test quiz master prompt formatting."""
@@ -76,3 +113,23 @@ class TestPromptTemplates:
         )
         assert "No answer provided" in prompt
 
+    def test_templates_render_without_indentation(self):
+        """Test templates render byte-for-byte with no leading indentation."""
+        assert format_quiz_master_prompt(study_note="Note") == (
+            "You must return valid JSON only.\nStudy note source:\nNote\n"
+        )
+        assert format_agent_prompt(
+            agent_name="Tutor",
+            instructions="Be kind.",
+            context="Context",
+            memory=["Memory 1"],
+        ) == (
+            "You are the Tutor agent.\n"
+            "Instructions: Be kind.\n"
+            "\n"
+            "Session memory (may be empty):\n"
+            "Memory 1\n"
+            "---\n"
+            "Focused input:\n"
+            "Context\n"
+        )
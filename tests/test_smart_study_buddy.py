@@ -1,12 +1,25 @@
 """Tests for Smart Study Buddy core functionality."""
 
+import asyncio
 import json
-from unittest.mock import MagicMock, Mock, patch
+import sys
+import threading
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
+from cache import ResponseCache, make_cache_key
 from config import AppConfig
-from smart_study_buddy import QuizItem, SearchTool, SmartStudyBuddy
+from prompts import format_agent_prompt
+from smart_study_buddy import (
+    Agent,
+    QuizItem,
+    SearchError,
+    SearchTool,
+    SmartStudyBuddy,
+    _get_model,
+    main,
+)
 
 
 class TestSearchTool:
@@ -67,6 +80,143 @@ class TestSearchTool:
 
         assert "No public snippets were found." in result
 
+    @patch("smart_study_buddy.atexit.register")
+    @patch("smart_study_buddy.DDGS")
+    def test_search_reuses_session(self, mock_ddgs_class, mock_atexit_register):
+        """Test one DDGS session is opened and reused across queries."""
+        mock_ddgs_class.return_value.text.return_value = [{"title": "T", "body": "B"}]
+
+        tool = SearchTool(max_results=1, max_retries=1, retry_delay=0.1)
+        tool.run("first query")
+        tool.run("second query")
+
+        assert mock_ddgs_class.call_count == 1
+        assert mock_ddgs_class.return_value.text.call_count == 2
+        mock_atexit_register.assert_called_once()
+
+    @patch("smart_study_buddy.DDGS")
+    def test_search_cache_hit_skips_network(self, mock_ddgs_class):
+        """Test repeated queries are served from the cache."""
+        mock_ddgs = MagicMock()
+        mock_ddgs.__enter__.return_value = mock_ddgs
+        mock_ddgs.text.return_value = [{"title": "Cached", "body": "Cached body"}]
+        mock_ddgs_class.return_value = mock_ddgs
+
+        tool = SearchTool(max_results=1, max_retries=1, retry_delay=0.1, cache=ResponseCache())
+        first = tool.run("test query")
+        second = tool.run("test query")
+
+        assert first == second
+        assert mock_ddgs.text.call_count == 1
+
+    @patch("smart_study_buddy.DDGS")
+    def test_search_many_merges_and_dedups(self, mock_ddgs_class):
+        """Test concurrent sub-queries are merged with duplicates removed."""
+        results = {
+            "topic": [{"title": "Shared", "body": "Same body"}, {"title": "Only A", "body": "A"}],
+            "topic examples": [{"title": "Shared", "body": "Same body"}, {"title": "Only B", "body": "B"}],
+        }
+        mock_ddgs_class.return_value.text.side_effect = lambda query, max_results: results[query]
+
+        tool = SearchTool(max_results=2, max_retries=1, retry_delay=0.1)
+        rows = asyncio.run(tool.asearch_many(["topic", "topic examples"]))
+
+        assert rows == [("Shared", "Same body"), ("Only A", "A"), ("Only B", "B")]
+
+    @patch("smart_study_buddy.atexit.register")
+    def test_search_many_uses_one_session_per_worker(self, mock_atexit_register):
+        """Test concurrent sub-queries never share a throttled DDGS session."""
+        barrier = threading.Barrier(3, timeout=5)
+        sessions = []
+
+        class FakeDDGS:
+            def __exit__(self, *exc_info):
+                pass
+
+            def text(self, query, max_results):
+                sessions.append(self)
+                barrier.wait()  # All three queries must be in flight at once
+                return [{"title": query, "body": "B"}]
+
+        tool = SearchTool(max_results=1, max_retries=1, retry_delay=0.1)
+        with patch("smart_study_buddy.DDGS", FakeDDGS):
+            rows = asyncio.run(tool.asearch_many(["a", "b", "c"]))
+
+        assert [title for title, _ in rows] == ["a", "b", "c"]
+        assert len({id(session) for session in sessions}) == 3
+
+    @patch("smart_study_buddy.DDGS")
+    def test_search_many_raises_when_all_fail(self, mock_ddgs_class):
+        """Test SearchError is raised when every sub-query fails."""
+        mock_ddgs_class.return_value.text.side_effect = ConnectionError("down")
+
+        tool = SearchTool(max_results=2, max_retries=1, retry_delay=0.1)
+        with pytest.raises(SearchError, match="Search failed after 1 attempts"):
+            asyncio.run(tool.asearch_many(["topic", "topic examples"]))
+
+
+class TestAgent:
+    """Test Agent class."""
+
+    @patch("smart_study_buddy.genai.GenerativeModel")
+    def test_agents_share_model_per_settings(self, mock_model_class):
+        """Test agents with identical model settings reuse one GenerativeModel."""
+        _get_model.cache_clear()
+        try:
+            first = Agent(name="A", instructions="", model_name="test-model")
+            second = Agent(name="B", instructions="", model_name="test-model")
+            Agent(
+                name="C",
+                instructions="",
+                model_name="test-model",
+                response_mime_type="application/json",
+            )
+
+            assert first._model is second._model
+            # One construction per (model_name, response_mime_type) pair
+            assert mock_model_class.call_count == 2
+        finally:
+            _get_model.cache_clear()
+
+    @patch("smart_study_buddy.genai.GenerativeModel")
+    def test_arun_uses_precomputed_preamble(self, mock_model_class):
+        """Test the prompt sent to the model matches format_agent_prompt."""
+        _get_model.cache_clear()
+        try:
+            generate = AsyncMock(return_value=Mock(text=" Reply "))
+            mock_model_class.return_value.generate_content_async = generate
+            agent = Agent(name="Tutor", instructions="Be kind.", model_name="test-model")
+
+            assert asyncio.run(agent.arun("Context", ["Memory 1"])) == "Reply"
+            sent_prompt = generate.await_args.args[0]
+            assert sent_prompt == format_agent_prompt(
+                agent_name="Tutor",
+                instructions="Be kind.",
+                context="Context",
+                memory=["Memory 1"],
+            )
+        finally:
+            _get_model.cache_clear()
+
+    @patch("smart_study_buddy.genai.GenerativeModel")
+    def test_arun_with_rendered_memory_matches_list(self, mock_model_class):
+        """Test passing pre-rendered memory builds the same prompt as a memory list."""
+        _get_model.cache_clear()
+        try:
+            generate = AsyncMock(return_value=Mock(text="Reply"))
+            mock_model_class.return_value.generate_content_async = generate
+            agent = Agent(name="Tutor", instructions="Be kind.", model_name="test-model")
+
+            asyncio.run(agent.arun("Context", ["Memory 1", "Memory 2"]))
+            asyncio.run(agent.arun("Context", memory_rendered="Memory 1\nMemory 2"))
+            asyncio.run(agent.arun("Context", memory_rendered=""))
+
+            prompts = [call.args[0] for call in generate.await_args_list]
+            assert prompts[0] == prompts[1]
+            assert "None yet." in prompts[2]
+        finally:
+            _get_model.cache_clear()
+
 
 class TestQuizParsing:
     """Test quiz parsing functionality."""
@@ -100,6 +250,16 @@ Some extra text."""
         assert quiz is not None
         assert quiz.question == "What is X?"
 
+    def test_parse_quiz_braces_in_prose(self):
+        """Test stray braces outside the code block fall back to regex extraction."""
+        payload = """Sets use {curly} braces:
+```json
+{"question": "What is a set?", "options": ["A", "B"], "correct_answer": "B"}
+```"""
+        quiz = SmartStudyBuddy._parse_quiz(payload)
+        assert quiz is not None
+        assert quiz.correct_answer == "B"
+
     def test_parse_quiz_missing_fields(self):
         """Test parsing quiz with missing required fields."""
         payload = json.dumps({"question": "Test?"})
@@ -128,6 +288,34 @@ Some extra text."""
         assert quiz is not None
         assert quiz.correct_answer == "A"
 
+    def test_parse_quiz_list_array(self):
+        """Test parsing a JSON array of quizzes."""
+        payload = json.dumps([
+            {"question": "Q1?", "options": ["A", "B"], "correct_answer": "A"},
+            {"question": "Q2?", "options": ["C", "D"], "correct_answer": "D"},
+        ])
+        quizzes = SmartStudyBuddy._parse_quiz_list(payload)
+        assert [quiz.question for quiz in quizzes] == ["Q1?", "Q2?"]
+
+    def test_parse_quiz_list_skips_invalid_and_duplicates(self):
+        """Test invalid entries and repeated questions are dropped."""
+        payload = """```json
+[
+  {"question": "Q1?", "options": ["A", "B"], "correct_answer": "A"},
+  {"question": "Q1?", "options": ["A", "B"], "correct_answer": "B"},
+  {"question": "Broken?"}
+]
+```"""
+        quizzes = SmartStudyBuddy._parse_quiz_list(payload)
+        assert len(quizzes) == 1
+        assert quizzes[0].correct_answer == "A"
+
+    def test_parse_quiz_list_single_object(self):
+        """Test a single quiz object parses as a one-item list."""
+        payload = json.dumps({"question": "Q?", "options": ["A", "B"], "correct_answer": "B"})
+        quizzes = SmartStudyBuddy._parse_quiz_list(payload)
+        assert len(quizzes) == 1
+
     def test_parse_quiz_empty_payload(self):
         """Test parsing empty payload."""
         quiz = SmartStudyBuddy._parse_quiz("")
@@ -161,6 +349,14 @@ class TestAnswerNormalization:
         result = SmartStudyBuddy._normalize_answer("ban", options)
         assert result == "Banana"
 
+    def test_normalize_with_quiz_lowered_options(self):
+        """Test normalizing against a quiz's precomputed lower-cased options."""
+        quiz = QuizItem(question="Q?", options=["Apple", "Banana"], correct_answer="Banana")
+        assert quiz.options_lower == ["apple", "banana"]
+        assert quiz.correct_answer_lower == "banana"
+        result = SmartStudyBuddy._normalize_answer("BAN", quiz.options, quiz.options_lower)
+        assert result == "Banana"
+
     def test_normalize_empty_answer(self):
         """Test normalizing empty answer."""
         options = ["Apple", "Banana"]
@@ -187,6 +383,7 @@ class TestSmartStudyBuddy:
         """Create a mock search tool."""
         tool = Mock(spec=SearchTool)
         tool.run.return_value = "Test search results"
+        tool.asearch_many.return_value = [("Test", "Test search results")]
         return tool
 
     def test_remember_within_limit(self, config, mock_search_tool):
@@ -198,25 +395,329 @@ class TestSmartStudyBuddy:
 
     def test_remember_exceeds_limit(self, config, mock_search_tool):
         """Test memory management when exceeding limit."""
-        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
         config.memory_limit = 3
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
         for i in range(5):
             buddy._remember(f"Entry {i}")
         assert len(buddy.memory) == 3
         assert buddy.memory[0] == "Entry 2"  # First two should be removed
 
+    def test_render_memory_cached_until_remember(self, config, mock_search_tool):
+        """Test rendered memory is reused within a turn and refreshed on _remember."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy._remember("Entry 1")
+        first = buddy._render_memory()
+        assert buddy._render_memory() is first
+
+        buddy._remember("Entry 2")
+        assert buddy._render_memory() == "Entry 1\nEntry 2"
+
+    def test_remember_appends_session_log(self, mock_search_tool, tmp_path):
+        """Test memory entries are written to the JSONL session log in the background."""
+        log_path = tmp_path / "logs" / "session.jsonl"
+        config = AppConfig(gemini_api_key="test-key", session_log_path=str(log_path))
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+
+        buddy._remember("Entry 1")
+        buddy._remember("Entry 2")
+        buddy.close()
+
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [record["entry"] for record in records] == ["Entry 1", "Entry 2"]
+        assert list(buddy.memory) == ["Entry 1", "Entry 2"]
+
     @patch("smart_study_buddy.Agent")
     def test_generate_study_note(self, mock_agent_class, config, mock_search_tool):
         """Test study note generation."""
         mock_agent = Mock()
-        mock_agent.run.return_value = "Generated study note"
+        mock_agent.arun = AsyncMock(return_value="Generated study note")
         mock_agent_class.return_value = mock_agent
 
         buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
         buddy.researcher = mock_agent
 
-        note = buddy._generate_study_note("Test Topic")
+        note = asyncio.run(buddy._agenerate_study_note("Test Topic"))
         assert note == "Generated study note"
         assert len(buddy.memory) == 1
         assert "StudyNote::" in buddy.memory[0]
 
+    def test_agenerate_study_note_cached_per_topic(self, config, mock_search_tool):
+        """Test repeat topics skip the search and Researcher calls."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.researcher = Mock()
+        buddy.researcher.arun = AsyncMock(return_value="Generated study note")
+
+        first = asyncio.run(buddy._agenerate_study_note("Test Topic"))
+        second = asyncio.run(buddy._agenerate_study_note("  test topic "))
+
+        assert first == second == "Generated study note"
+        assert buddy.researcher.arun.await_count == 2  # Outline priming + final note, once
+        assert mock_search_tool.asearch_many.await_count == 1
+        assert len(buddy.memory) == 2
+
+    def test_agenerate_study_note_skips_cache_when_search_fails(self, config, mock_search_tool):
+        """Test notes written without search results are regenerated next time."""
+        mock_search_tool.asearch_many.side_effect = SearchError("Search failed")
+        cache = ResponseCache()
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool, cache=cache)
+        buddy.researcher = Mock()
+        buddy.researcher.arun = AsyncMock(return_value="Ungrounded note")
+
+        asyncio.run(buddy._agenerate_study_note("Test Topic"))
+        asyncio.run(buddy._agenerate_study_note("Test Topic"))
+
+        assert mock_search_tool.asearch_many.await_count == 2
+        assert "Search failed" in buddy.researcher.arun.await_args_list[1].args[0]
+        assert cache.get(make_cache_key("study-note", buddy._study_note_key("Test Topic"))) is None
+
+    def test_lookup_study_note_treats_empty_note_as_miss(self, config, mock_search_tool):
+        """Test an empty note left in the on-disk cache does not count as a hit."""
+        cache = ResponseCache()
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool, cache=cache)
+        cache.set(make_cache_key("study-note", buddy._study_note_key("Test Topic")), "")
+
+        assert buddy._lookup_study_note("Test Topic") is None
+
+    def test_agenerate_quiz_replays_from_cache(self, config, mock_search_tool):
+        """Test QuizMaster output is replayed for the same note and ordinal without a rewrite."""
+        cache = ResponseCache()
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool, cache=cache)
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.arun = AsyncMock(return_value=json.dumps({
+            "question": "What is 2+2?",
+            "options": ["3", "4"],
+            "correct_answer": "4",
+        }))
+
+        with patch.object(cache, "set", wraps=cache.set) as mock_set:
+            first = asyncio.run(buddy._agenerate_quiz("Study note", ordinal=1))
+            second = asyncio.run(buddy._agenerate_quiz("Study note", ordinal=1))
+
+        assert first == second
+        assert buddy.quiz_master.arun.await_count == 1
+        mock_set.assert_called_once()  # Replay must not refresh the entry's TTL
+
+    def test_agenerate_quiz_batch_replay_keeps_ttl(self, config, mock_search_tool):
+        """Test a replayed QuizMaster batch is not written back to the cache."""
+        cache = ResponseCache()
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool, cache=cache)
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.arun = AsyncMock(return_value=json.dumps([
+            {"question": "Q1?", "options": ["A", "B"], "correct_answer": "A"},
+        ]))
+
+        with patch.object(cache, "set", wraps=cache.set) as mock_set:
+            first = asyncio.run(buddy._agenerate_quiz_batch("Study note", 1))
+            second = asyncio.run(buddy._agenerate_quiz_batch("Study note", 1))
+
+        assert first == second
+        assert buddy.quiz_master.arun.await_count == 1
+        mock_set.assert_called_once()
+
+    def test_agenerate_study_note_primes_researcher(self, config, mock_search_tool):
+        """Test async study note generation feeds search and outline into the note."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.researcher = Mock()
+        buddy.researcher.arun = AsyncMock(side_effect=["- Subtopic A", "Final note"])
+
+        note = asyncio.run(buddy._agenerate_study_note("Test Topic"))
+
+        assert note == "Final note"
+        mock_search_tool.asearch_many.assert_awaited_once_with(
+            SmartStudyBuddy._search_queries("Test Topic")
+        )
+        final_context = buddy.researcher.arun.await_args_list[-1].args[0]
+        assert "Test search results" in final_context
+        assert "- Subtopic A" in final_context
+        assert len(buddy.memory) == 1
+
+    def test_interactive_session_prefetches_next_quiz(self, config, mock_search_tool):
+        """Test the next quiz is requested before the current answer is graded."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.researcher = Mock()
+        buddy.researcher.arun = AsyncMock(return_value="Study note")
+
+        calls = []
+        quiz_payload = json.dumps({
+            "question": "What is 2+2?",
+            "options": ["3", "4"],
+            "correct_answer": "4",
+        })
+
+        async def quiz_side_effect(*args, **kwargs):
+            calls.append("quiz")
+            return quiz_payload
+
+        async def tutor_stream(*args, **kwargs):
+            calls.append("tutor")
+            yield "Well done"
+
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.arun = AsyncMock(side_effect=quiz_side_effect)
+        buddy.tutor = Mock()
+        buddy.tutor.arun_stream = Mock(side_effect=tutor_stream)
+
+        async def answer(prompt):
+            await asyncio.sleep(0)  # Yield like real terminal input would
+            return "2"
+
+        with patch.object(SmartStudyBuddy, "_ainput", side_effect=answer):
+            buddy.interactive_session("Math", questions=2)
+
+        assert calls == ["quiz", "quiz", "tutor", "tutor"]
+
+    def test_prefetched_quiz_remembered_when_asked(self, config, mock_search_tool):
+        """Test a prefetched quiz stays out of memory until it is shown."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.researcher = Mock()
+        buddy.researcher.arun = AsyncMock(return_value="note")
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.arun = AsyncMock(side_effect=[
+            json.dumps({"question": f"Q{idx}?", "options": ["A", "B"], "correct_answer": "A"})
+            for idx in range(2)
+        ])
+
+        tutor_memories = []
+
+        async def tutor_stream(context, memory_rendered=None):
+            tutor_memories.append(memory_rendered)
+            yield "Feedback"
+
+        buddy.tutor = Mock()
+        buddy.tutor.arun_stream = Mock(side_effect=tutor_stream)
+
+        async def answer(prompt):
+            await asyncio.sleep(0)  # Let the prefetch task finish first
+            return "1"
+
+        with patch.object(SmartStudyBuddy, "_ainput", side_effect=answer):
+            buddy.interactive_session("Letters", questions=2)
+
+        assert tutor_memories[0] == "StudyNote::note\nQuiz::Q0?"
+        assert list(buddy.memory) == [
+            "StudyNote::note",
+            "Quiz::Q0?",
+            "Feedback::Feedback",
+            "Quiz::Q1?",
+            "Feedback::Feedback",
+        ]
+
+    def test_interactive_session_uses_single_batch_call(self, config, mock_search_tool):
+        """Test a full batch avoids per-question QuizMaster calls."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.researcher = Mock()
+        buddy.researcher.arun = AsyncMock(return_value="Study note")
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.arun = AsyncMock(return_value=json.dumps([
+            {"question": "Q1?", "options": ["A", "B"], "correct_answer": "A"},
+            {"question": "Q2?", "options": ["C", "D"], "correct_answer": "D"},
+        ]))
+
+        async def tutor_stream(*args, **kwargs):
+            yield "Well done"
+
+        buddy.tutor = Mock()
+        buddy.tutor.arun_stream = Mock(side_effect=tutor_stream)
+
+        with patch.object(buddy, "_aget_user_answer", AsyncMock(return_value="1")):
+            buddy.interactive_session("Letters", questions=2)
+
+        assert buddy.quiz_master.arun.await_count == 1
+        assert buddy.tutor.arun_stream.call_count == 2
+        assert "Quiz::Q2?" in buddy.memory
+
+    def test_interactive_session_zero_questions_skips_quiz_master(self, config, mock_search_tool):
+        """Test a zero-question session makes no QuizMaster call."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.researcher = Mock()
+        buddy.researcher.arun = AsyncMock(return_value="Study note")
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.arun = AsyncMock()
+
+        buddy.interactive_session("Letters", questions=0)
+
+        buddy.quiz_master.arun.assert_not_awaited()
+
+    def test_agrade_and_feedback_streams_to_stdout(self, config, mock_search_tool, capsys):
+        """Test Tutor chunks are echoed as they arrive and remembered in full."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+
+        async def tutor_stream(*args, **kwargs):
+            for chunk in ["Correct! ", "Keep going."]:
+                yield chunk
+
+        buddy.tutor = Mock()
+        buddy.tutor.arun_stream = Mock(side_effect=tutor_stream)
+        quiz = QuizItem(question="Q?", options=["A", "B"], correct_answer="A")
+
+        feedback = asyncio.run(buddy._agrade_and_feedback(quiz, "A", "Study note"))
+
+        assert feedback == "Correct! Keep going."
+        assert capsys.readouterr().out == "Correct! Keep going."
+        assert buddy.memory[-1] == "Feedback::Correct! Keep going."
+
+    def test_aget_user_answer_retries_empty_input(self, config, mock_search_tool):
+        """Test empty input is re-prompted before a valid answer is accepted."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        with patch.object(SmartStudyBuddy, "_ainput", AsyncMock(side_effect=["", " 2 "])):
+            answer = asyncio.run(buddy._aget_user_answer(["A", "B"]))
+        assert answer == "2"
+
+    @patch("smart_study_buddy.ainput", None)
+    def test_ainput_falls_back_to_daemon_thread(self):
+        """Test input() runs on a daemon thread when aioconsole is unavailable."""
+        threads = []
+
+        def fake_input(prompt):
+            threads.append(threading.current_thread())
+            return "typed"
+
+        with patch("builtins.input", side_effect=fake_input) as mock_input:
+            assert asyncio.run(SmartStudyBuddy._ainput("Prompt: ")) == "typed"
+
+        mock_input.assert_called_once_with("Prompt: ")
+        assert threads[0] is not threading.main_thread()
+        assert threads[0].daemon
+
+    @patch("smart_study_buddy.ainput", None)
+    @patch("builtins.input", side_effect=EOFError)
+    def test_ainput_propagates_eof(self, mock_input):
+        """Test end of input surfaces in the awaiting task."""
+        with pytest.raises(EOFError):
+            asyncio.run(SmartStudyBuddy._ainput("Prompt: "))
+
+    def test_interactive_session_quit_skips_grading(self, config, mock_search_tool, capsys):
+        """Test answering 'q' ends the session without calling the Tutor."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.researcher = Mock()
+        buddy.researcher.arun = AsyncMock(return_value="Study note")
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.arun = AsyncMock(return_value=json.dumps([
+            {"question": "Q1?", "options": ["A", "B"], "correct_answer": "A"},
+            {"question": "Q2?", "options": ["C", "D"], "correct_answer": "D"},
+        ]))
+        buddy.tutor = Mock()
+
+        with patch.object(SmartStudyBuddy, "_ainput", AsyncMock(return_value="q")) as mock_ainput:
+            buddy.interactive_session("Letters", questions=2)
+
+        assert mock_ainput.await_count == 1
+        buddy.tutor.arun_stream.assert_not_called()
+        assert "Score: 0/2" in capsys.readouterr().out
+
+    @patch("smart_study_buddy.genai.configure")
+    @patch.object(SmartStudyBuddy, "interactive_session", side_effect=KeyboardInterrupt)
+    @patch.object(SmartStudyBuddy, "close")
+    def test_main_exits_immediately_on_ctrl_c(
+        self, mock_close, mock_session, mock_configure, monkeypatch
+    ):
+        """Test Ctrl-C closes resources and exits without waiting on the input thread."""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        monkeypatch.setattr(sys, "argv", ["smart_study_buddy", "--topic", "Math", "--no-cache"])
+
+        with patch("smart_study_buddy.os._exit", side_effect=SystemExit) as mock_exit:
+            with pytest.raises(SystemExit):
+                main()
+
+        mock_close.assert_called_once_with()
+        mock_exit.assert_called_once_with(130)